@@ -0,0 +1,40 @@
+# backend/api/admin.py
+"""Admin endpoints for reading captured request profiles."""
+
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from services.profiling import is_admin, list_profiles, get_profile, to_collapsed
+
+router = APIRouter(prefix="/api/v1/admin", tags=["Admin"])
+
+
+def _require_admin(token: Optional[str]) -> None:
+    if not is_admin(token):
+        raise HTTPException(status_code=403, detail="Invalid or missing admin token")
+
+
+@router.get("/profiles")
+def list_request_profiles(x_admin_token: Optional[str] = Header(None)):
+    """List recently captured profiles, most recent first."""
+    _require_admin(x_admin_token)
+    return {"data": list_profiles()}
+
+
+@router.get("/profiles/{profile_id}")
+def get_request_profile(
+    profile_id: str,
+    format: str = "json",
+    x_admin_token: Optional[str] = Header(None),
+):
+    """
+    Get a captured profile.
+    Use format=collapsed for flamegraph-ready collapsed stacks.
+    """
+    _require_admin(x_admin_token)
+    profile = get_profile(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if format == "collapsed":
+        return PlainTextResponse(to_collapsed(profile))
+    return {"data": profile}
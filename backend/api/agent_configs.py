@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 from supabase_client import supabase
+from services.tracing import db_span
 
 router = APIRouter(prefix="/api/v1", tags=["Agent Configs"])
 
@@ -24,7 +25,8 @@ class AgentConfigResponse(BaseModel):
 def list_agent_configs():
     """List all agent configurations."""
     try:
-        result = supabase.table("agent_configs").select("*").order("created_at", desc=True).execute()
+        with db_span("agent_configs", "select"):
+            result = supabase.table("agent_configs").select("*").order("created_at", desc=True).execute()
         return {"data": result.data}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -33,7 +35,8 @@ def list_agent_configs():
 def get_agent_config(config_id: str):
     """Get a single agent configuration by ID."""
     try:
-        result = supabase.table("agent_configs").select("*").eq("id", config_id).single().execute()
+        with db_span("agent_configs", "select"):
+            result = supabase.table("agent_configs").select("*").eq("id", config_id).single().execute()
         if not result.data:
             raise HTTPException(status_code=404, detail="Agent config not found")
         return {"data": result.data}
@@ -47,11 +50,12 @@ def get_agent_config(config_id: str):
 def create_agent_config(body: AgentConfigInput):
     """Create a new agent configuration."""
     try:
-        result = supabase.table("agent_configs").insert({
-            "name": body.name,
-            "description": body.description,
-            "config": body.config
-        }).execute()
+        with db_span("agent_configs", "insert"):
+            result = supabase.table("agent_configs").insert({
+                "name": body.name,
+                "description": body.description,
+                "config": body.config
+            }).execute()
         return {"data": result.data[0] if result.data else None}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -61,16 +65,17 @@ def create_agent_config(body: AgentConfigInput):
 def update_agent_config(config_id: str, body: AgentConfigInput):
     """Update an existing agent configuration."""
     try:
-        result = (
-            supabase.table("agent_configs")
-            .update({
-                "name": body.name,
-                "description": body.description,
-                "config": body.config
-            })
-            .eq("id", config_id)
-            .execute()
-        )
+        with db_span("agent_configs", "update"):
+            result = (
+                supabase.table("agent_configs")
+                .update({
+                    "name": body.name,
+                    "description": body.description,
+                    "config": body.config
+                })
+                .eq("id", config_id)
+                .execute()
+            )
         if not result.data:
             raise HTTPException(status_code=404, detail="Agent config not found")
         return {"data": result.data[0]}
@@ -84,12 +89,13 @@ def update_agent_config(config_id: str, body: AgentConfigInput):
 def delete_agent_config(config_id: str):
     """Delete an agent configuration."""
     try:
-        result = (
-            supabase.table("agent_configs")
-            .delete()
-            .eq("id", config_id)
-            .execute()
-        )
+        with db_span("agent_configs", "delete"):
+            result = (
+                supabase.table("agent_configs")
+                .delete()
+                .eq("id", config_id)
+                .execute()
+            )
         return {"success": True, "deleted_id": config_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -99,12 +105,13 @@ def delete_agent_config(config_id: str):
 def bulk_delete_agent_configs(ids: List[str]):
     """Delete multiple agent configurations."""
     try:
-        result = (
-            supabase.table("agent_configs")
-            .delete()
-            .in_("id", ids)
-            .execute()
-        )
+        with db_span("agent_configs", "delete"):
+            result = (
+                supabase.table("agent_configs")
+                .delete()
+                .in_("id", ids)
+                .execute()
+            )
         return {"success": True, "deleted_count": len(ids)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -4,6 +4,7 @@
 from typing import List
 from fastapi import APIRouter, HTTPException
 from supabase_client import supabase
+from services.tracing import db_span
 
 router = APIRouter(prefix="/api/v1", tags=["Calls"])
 
@@ -12,7 +13,8 @@ router = APIRouter(prefix="/api/v1", tags=["Calls"])
 def list_calls():
     """List all calls, most recent first."""
     try:
-        result = supabase.table("calls").select("*").order("created_at", desc=True).execute()
+        with db_span("calls", "select"):
+            result = supabase.table("calls").select("*").order("created_at", desc=True).execute()
         return {"data": result.data}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -22,7 +24,8 @@ def list_calls():
 def get_call(call_id: str):
     """Get a single call with full details."""
     try:
-        result = supabase.table("calls").select("*").eq("id", call_id).single().execute()
+        with db_span("calls", "select"):
+            result = supabase.table("calls").select("*").eq("id", call_id).single().execute()
         
         if not result.data:
             raise HTTPException(status_code=404, detail="Call not found")
@@ -57,7 +60,8 @@ def get_call(call_id: str):
 def delete_call(call_id: str):
     """Delete a single call."""
     try:
-        supabase.table("calls").delete().eq("id", call_id).execute()
+        with db_span("calls", "delete"):
+            supabase.table("calls").delete().eq("id", call_id).execute()
         return {"success": True, "deleted_id": call_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -67,7 +71,8 @@ def delete_call(call_id: str):
 def bulk_delete_calls(ids: List[str]):
     """Delete multiple calls."""
     try:
-        supabase.table("calls").delete().in_("id", ids).execute()
+        with db_span("calls", "delete"):
+            supabase.table("calls").delete().in_("id", ids).execute()
         return {"success": True, "deleted_count": len(ids)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
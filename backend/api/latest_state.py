@@ -0,0 +1,62 @@
+# backend/api/latest_state.py
+"""API endpoints for the latest status/ETA/location per load and driver."""
+
+from typing import List
+from fastapi import APIRouter, HTTPException
+from supabase_client import supabase
+from services.latest_state import LOAD_STATE_TABLE, DRIVER_STATE_TABLE
+from services.tracing import db_span
+
+router = APIRouter(prefix="/api/v1", tags=["Latest State"])
+
+# Load numbers go into a PostgREST in.(...) filter in the query string
+MAX_BULK_LOAD_NUMBERS = 100
+
+
+@router.get("/loads/{load_number}/latest")
+def get_load_latest_state(load_number: str):
+    """Get the latest state for a single load."""
+    try:
+        with db_span(LOAD_STATE_TABLE, "select"):
+            result = supabase.table(LOAD_STATE_TABLE).select("*").eq("load_number", load_number).execute()
+        if not result.data:
+            raise HTTPException(status_code=404, detail="No completed calls for this load")
+        return {"data": result.data[0]}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/loads/latest")
+def bulk_get_load_latest_state(load_numbers: List[str]):
+    """Get the latest state for many loads in one read, keyed by load number."""
+    load_numbers = list(dict.fromkeys(load_numbers))
+    if len(load_numbers) > MAX_BULK_LOAD_NUMBERS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {MAX_BULK_LOAD_NUMBERS} load numbers per request"
+        )
+
+    try:
+        with db_span(LOAD_STATE_TABLE, "select"):
+            result = supabase.table(LOAD_STATE_TABLE).select("*").in_("load_number", load_numbers).execute()
+        states = {row["load_number"]: row for row in result.data or []}
+        return {"data": {load_number: states.get(load_number) for load_number in load_numbers}}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/drivers/{driver_phone}/latest")
+def get_driver_latest_state(driver_phone: str):
+    """Get the latest state for a single driver."""
+    try:
+        with db_span(DRIVER_STATE_TABLE, "select"):
+            result = supabase.table(DRIVER_STATE_TABLE).select("*").eq("driver_phone", driver_phone).execute()
+        if not result.data:
+            raise HTTPException(status_code=404, detail="No completed calls for this driver")
+        return {"data": result.data[0]}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
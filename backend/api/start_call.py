@@ -4,6 +4,7 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from supabase_client import supabase
+from services.tracing import span, db_span, current_traceparent
 import httpx
 import os
 from datetime import datetime
@@ -29,9 +30,16 @@ class StartCallInput(BaseModel):
 @router.post("/start-call")
 async def start_call(body: StartCallInput):
     """Initiate a new web call via Retell AI with custom prompt from config."""
+    with span("start_call", agent_config_id=body.agent_config_id, load_number=body.load_number):
+        return await _start_call(body)
+
+
+async def _start_call(body: StartCallInput):
+    """Create the call record and request a Retell web call for it."""
 
     # 1. Fetch agent config to get custom prompt
-    config_result = supabase.table("agent_configs").select("*").eq("id", body.agent_config_id).single().execute()
+    with db_span("agent_configs", "select"):
+        config_result = supabase.table("agent_configs").select("*").eq("id", body.agent_config_id).single().execute()
     
     if not config_result.data:
         raise HTTPException(status_code=404, detail="Agent config not found")
@@ -50,17 +58,18 @@ async def start_call(body: StartCallInput):
     emergency_triggers = ", ".join(emergency_triggers_list) if emergency_triggers_list else ""
 
     # 2. Insert call record in Supabase
-    inserted = supabase.table("calls").insert({
-        "agent_config_id": body.agent_config_id,
-        "driver_name": body.driver_name,
-        "driver_phone": body.driver_phone,
-        "load_number": body.load_number,
-        "status": "queued",
-        "metadata": {},
-        "retell_call_id": None,
-        "started_at": None,
-        "ended_at": None
-    }).execute()
+    with db_span("calls", "insert"):
+        inserted = supabase.table("calls").insert({
+            "agent_config_id": body.agent_config_id,
+            "driver_name": body.driver_name,
+            "driver_phone": body.driver_phone,
+            "load_number": body.load_number,
+            "status": "queued",
+            "metadata": {},
+            "retell_call_id": None,
+            "started_at": None,
+            "ended_at": None
+        }).execute()
 
     if not inserted.data:
         raise HTTPException(status_code=500, detail="Failed to insert call into database")
@@ -74,7 +83,8 @@ async def start_call(body: StartCallInput):
             "call_id": call_id,
             "agent_config_id": body.agent_config_id,
             "driver_name": body.driver_name,
-            "load_number": body.load_number
+            "load_number": body.load_number,
+            "traceparent": current_traceparent()  # Joins the call_ended webhook to this trace
         },
         "retell_llm_dynamic_variables": {
             "custom_prompt": custom_prompt,           # YOUR prompt from database!
@@ -93,18 +103,22 @@ async def start_call(body: StartCallInput):
 
     # 4. Call Retell API
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                RETELL_API_URL,
-                json=payload,
-                headers=headers
-            )
+        with span("retell.create_web_call", call_id=call_id) as retell_span:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                response = await client.post(
+                    RETELL_API_URL,
+                    json=payload,
+                    headers=headers
+                )
+            retell_span.set_attribute("http_status_code", response.status_code)
     except Exception as e:
-        supabase.table("calls").update({"status": "failed"}).eq("id", call_id).execute()
+        with db_span("calls", "update"):
+            supabase.table("calls").update({"status": "failed"}).eq("id", call_id).execute()
         raise HTTPException(status_code=500, detail=f"Retell connection error: {str(e)}")
 
     if response.status_code >= 400:
-        supabase.table("calls").update({"status": "failed"}).eq("id", call_id).execute()
+        with db_span("calls", "update"):
+            supabase.table("calls").update({"status": "failed"}).eq("id", call_id).execute()
         raise HTTPException(status_code=500, detail=f"Retell API error: {response.text}")
 
     retell_data = response.json()
@@ -113,11 +127,12 @@ async def start_call(body: StartCallInput):
     expires_in = retell_data.get("expires_in")
 
     # 5. Update call record
-    supabase.table("calls").update({
-        "status": "in_progress",
-        "retell_call_id": retell_call_id,
-        "started_at": datetime.utcnow().isoformat()
-    }).eq("id", call_id).execute()
+    with db_span("calls", "update"):
+        supabase.table("calls").update({
+            "status": "in_progress",
+            "retell_call_id": retell_call_id,
+            "started_at": datetime.utcnow().isoformat()
+        }).eq("id", call_id).execute()
 
     # 6. Return to frontend
     return {
@@ -2,9 +2,11 @@
 
 import logging
 from fastapi import APIRouter, Request, HTTPException
-from datetime import datetime
+from datetime import datetime, timezone
 from supabase_client import supabase
 from services.postprocess import run_post_processing_from_event
+from services.latest_state import update_latest_state
+from services.tracing import span, db_span, parse_traceparent
 
 logger = logging.getLogger(__name__)
 
@@ -29,12 +31,28 @@ async def retell_webhook(request: Request):
     if event_type != "call_ended":
         return {"status": "ignored", "event": event_type}
 
-    # Extract call data
+    # Join the trace started in start_call via the traceparent we sent to Retell
     call_data = payload.get("call", {})
+    metadata = call_data.get("metadata", {}) or {}
+    parent = parse_traceparent(metadata.get("traceparent"))
+
+    with span("retell_webhook", parent=parent, call_id=metadata.get("call_id")):
+        return _handle_call_ended(call_data)
+
+
+def _handle_call_ended(call_data: dict):
+    """Persist a completed call and its structured data."""
     retell_call_id = call_data.get("call_id")
     transcript = call_data.get("transcript", "")
     transcript_object = call_data.get("transcript_object", [])
     call_analysis = call_data.get("call_analysis", {})
+
+    # Prefer Retell's end time (epoch ms) so late or retried webhooks keep the real order
+    end_timestamp = call_data.get("end_timestamp")
+    if end_timestamp:
+        ended_at = datetime.fromtimestamp(end_timestamp / 1000, tz=timezone.utc).isoformat()
+    else:
+        ended_at = datetime.now(timezone.utc).isoformat()
     
     # Get our call ID from metadata
     metadata = call_data.get("metadata", {})
@@ -42,7 +60,8 @@ async def retell_webhook(request: Request):
 
     if not our_call_id:
         # Try to find call by retell_call_id
-        result = supabase.table("calls").select("*").eq("retell_call_id", retell_call_id).execute()
+        with db_span("calls", "select"):
+            result = supabase.table("calls").select("*").eq("retell_call_id", retell_call_id).execute()
         if result.data:
             our_call_id = result.data[0]["id"]
         else:
@@ -57,16 +76,24 @@ async def retell_webhook(request: Request):
     )
 
     # Update call record with completion status
-    supabase.table("calls").update({
-        "status": "completed",
-        "ended_at": datetime.utcnow().isoformat(),
-        "metadata": {
-            "transcript": transcript,
-            "transcript_object": transcript_object,
-            "call_analysis": call_analysis,
-            "structured_data": structured_data
-        }
-    }).eq("id", our_call_id).execute()
+    with db_span("calls", "update"):
+        updated = supabase.table("calls").update({
+            "status": "completed",
+            "ended_at": ended_at,
+            "metadata": {
+                "transcript": transcript,
+                "transcript_object": transcript_object,
+                "call_analysis": call_analysis,
+                "structured_data": structured_data
+            }
+        }).eq("id", our_call_id).execute()
+
+    # Refresh the per-load / per-driver latest state; never fail the webhook over it
+    if updated.data:
+        try:
+            update_latest_state(updated.data[0], structured_data)
+        except Exception as e:
+            logger.warning(f"Failed to update latest state for call {our_call_id}: {e}")
 
     return {
         "status": "success",
@@ -12,6 +12,9 @@ from api.agent_configs import router as agent_router
 from api.start_call import router as start_call_router
 from api.webhook import router as webhook_router
 from api.calls import router as calls_router
+from api.latest_state import router as latest_state_router
+from api.admin import router as admin_router
+from services.profiling import ProfilingMiddleware
 
 app = FastAPI(
     title="AI Voice Agent API",
@@ -26,12 +29,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Profile-Id"],
 )
 
+
+# Opt-in request profiling - via X-Profile admin header or PROFILE_SAMPLE_RATE
+app.add_middleware(ProfilingMiddleware)
+
 # Include API routers
 app.include_router(agent_router)
 app.include_router(start_call_router)
 app.include_router(calls_router)
+app.include_router(latest_state_router)
+app.include_router(admin_router)
 
 # Webhook router (no /api/v1 prefix - external service callback)
 app.include_router(webhook_router)
@@ -0,0 +1,72 @@
+# backend/services/latest_state.py
+"""
+Latest-state index for loads and drivers.
+Each completed call upserts one row per load_number and per driver_phone,
+so "what's the latest on load X?" is a single primary-key read.
+
+Writes go through the upsert_latest_state Postgres function (see README),
+which only applies a call whose end time is not older than the stored row,
+so retries and late webhooks never replace newer state. Fields the call
+did not report (None) keep their previous value; emergency fields describe
+the applied call, and last_emergency_at records when the last one happened.
+"""
+
+from typing import Dict, Any
+from supabase_client import supabase
+from services.tracing import db_span
+
+LOAD_STATE_TABLE = "load_latest_state"
+DRIVER_STATE_TABLE = "driver_latest_state"
+UPSERT_FUNCTION = "upsert_latest_state"
+
+
+def build_latest_state(
+    call: Dict[str, Any],
+    structured_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Build the latest-state record for a completed call.
+
+    Args:
+        call: Call row as stored in the calls table
+        structured_data: Output of extract_structured_data
+
+    Returns:
+        Dict with the fields shared by both state tables
+    """
+    is_emergency = structured_data.get("call_type") == "emergency"
+    driver_status = structured_data.get("driver_status")
+
+    return {
+        "call_id": call.get("id"),
+        "load_number": call.get("load_number"),
+        "driver_phone": call.get("driver_phone"),
+        "driver_name": call.get("driver_name"),
+        "call_type": structured_data.get("call_type"),
+        "call_outcome": structured_data.get("call_outcome"),
+        # "Unknown" means the call didn't tell us, so keep the last known status
+        "driver_status": driver_status if driver_status != "Unknown" else None,
+        # Emergency calls report location as emergency_location
+        "current_location": (
+            structured_data.get("current_location")
+            or structured_data.get("emergency_location")
+        ),
+        "eta": structured_data.get("eta"),
+        "emergency_type": structured_data.get("emergency_type"),
+        "escalation_status": structured_data.get("escalation_status"),
+        "last_emergency_at": call.get("ended_at") if is_emergency else None,
+        "updated_at": call.get("ended_at"),
+    }
+
+
+def update_latest_state(
+    call: Dict[str, Any],
+    structured_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Apply the call to the latest state for its load and driver."""
+    state = build_latest_state(call, structured_data)
+
+    with db_span(UPSERT_FUNCTION, "rpc"):
+        supabase.rpc(UPSERT_FUNCTION, {"state": state}).execute()
+
+    return state
@@ -8,6 +8,8 @@ Fallback: Basic regex extraction from transcript
 from typing import Dict, Any, Optional
 import re
 
+from services.tracing import traced
+
 # Emergency trigger keywords
 EMERGENCY_TRIGGERS = frozenset([
     "accident", "crash", "blowout", "breakdown", "emergency",
@@ -228,6 +230,7 @@ def _extract_eta(text: str) -> Optional[str]:
 
 
 # Legacy function name for backward compatibility
+@traced("postprocess.run_post_processing_from_event")
 def run_post_processing_from_event(
     transcript: Optional[str],
     analysis_obj: Optional[Dict[str, Any]],
@@ -0,0 +1,215 @@
+# backend/services/profiling.py
+"""
+On-demand statistical profiling of API requests.
+A background thread samples the event loop thread's stack at a fixed interval
+and folds the samples into collapsed stacks ("a;b;c 42"), which flamegraph
+tools (flamegraph.pl, speedscope, inferno) read directly.
+
+The event loop runs every in-flight request, so a sample is only kept when
+the profiled request's own task is on the stack. Samples where another
+request was running or the loop was idle in select() are counted separately,
+along with the peak number of in-flight requests during the window. Time
+spent awaiting I/O is not sampled (it shows as duration_ms beyond the
+samples), and sync endpoints that run in the threadpool are not covered.
+
+Profiling is opt-in per request; unprofiled requests pass straight through.
+Configure with environment variables:
+    PROFILE_ADMIN_TOKEN: token for the X-Profile header and admin endpoints
+    PROFILE_SAMPLE_RATE: fraction of requests profiled automatically (default: 0)
+    PROFILE_INTERVAL_MS: sampling interval in milliseconds (default: 5)
+    PROFILE_BUFFER_SIZE: number of recent profiles kept (default: 20)
+"""
+
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timezone
+from types import FrameType
+from typing import Any, Deque, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+PROFILE_ADMIN_TOKEN = os.getenv("PROFILE_ADMIN_TOKEN")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+PROFILE_BUFFER_SIZE = int(os.getenv("PROFILE_BUFFER_SIZE", "20"))
+
+_profiles: Deque[Dict[str, Any]] = deque(maxlen=PROFILE_BUFFER_SIZE)
+_profiles_lock = threading.Lock()
+
+# Requests currently being handled; only touched on the event loop thread
+_in_flight = 0
+
+
+def is_admin(token: Optional[str]) -> bool:
+    """Check a request token against PROFILE_ADMIN_TOKEN."""
+    if not PROFILE_ADMIN_TOKEN or not token:
+        return False
+    return secrets.compare_digest(token, PROFILE_ADMIN_TOKEN)
+
+
+def should_profile(token: Optional[str]) -> bool:
+    """Decide whether to profile a request (admin header or sampling)."""
+    if token is not None and is_admin(token):
+        return True
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+
+class SamplingProfiler:
+    """Samples the current thread's stack, keeping frames under root_frame."""
+
+    def __init__(
+        self,
+        name: str,
+        root_frame: FrameType,
+        interval_ms: float = PROFILE_INTERVAL_MS,
+    ):
+        self.id = secrets.token_hex(8)
+        self.name = name
+        self.interval = interval_ms / 1000
+        self.samples: Counter = Counter()
+        self.other_task_samples = 0
+        self.idle_samples = 0
+        self.max_in_flight = _in_flight
+        self._root = root_frame
+        self._target = threading.get_ident()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._started_at = datetime.now(timezone.utc)
+        self._start = 0.0
+
+    def start(self) -> "SamplingProfiler":
+        self._start = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop sampling, store the profile in the ring buffer and return it."""
+        # No join: the sampler exits on its next wakeup, and the lock keeps
+        # late samples out of the snapshot without blocking the event loop.
+        with self._lock:
+            self._stop.set()
+            profile = {
+                "id": self.id,
+                "name": self.name,
+                "started_at": self._started_at.isoformat(),
+                "duration_ms": round((time.perf_counter() - self._start) * 1000, 3),
+                "interval_ms": self.interval * 1000,
+                "sample_count": sum(self.samples.values()),
+                "other_task_samples": self.other_task_samples,
+                "idle_samples": self.idle_samples,
+                "max_in_flight_requests": self.max_in_flight,
+                "samples": dict(self.samples),
+            }
+        with _profiles_lock:
+            _profiles.append(profile)
+        return profile
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            leaf = sys._current_frames().get(self._target)
+            stack = []
+            frame = leaf
+            while frame is not None and frame is not self._root:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                frame = frame.f_back
+
+            with self._lock:
+                if self._stop.is_set():
+                    return
+                self.max_in_flight = max(self.max_in_flight, _in_flight)
+                if frame is not None:
+                    if stack:
+                        self.samples[";".join(reversed(stack))] += 1
+                elif leaf is not None and _is_idle(leaf):
+                    self.idle_samples += 1
+                else:
+                    self.other_task_samples += 1
+
+
+def _is_idle(frame: FrameType) -> bool:
+    """True when the event loop is blocked waiting in its selector."""
+    code = frame.f_code
+    return code.co_name == "select" and code.co_filename.endswith("selectors.py")
+
+
+def _header(scope: Dict[str, Any], name: bytes) -> Optional[str]:
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that profiles requests chosen by should_profile.
+    Adds an X-Profile-Id response header to profiled requests.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.enabled = bool(PROFILE_ADMIN_TOKEN) or PROFILE_SAMPLE_RATE > 0
+
+    async def __call__(self, scope, receive, send):
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        global _in_flight
+        _in_flight += 1
+        try:
+            if scope["path"].startswith("/api/v1/admin") or not should_profile(_header(scope, b"x-profile")):
+                await self.app(scope, receive, send)
+                return
+
+            # This coroutine's frame is on the stack whenever the request's task runs
+            profiler = SamplingProfiler(f"{scope['method']} {scope['path']}", sys._getframe()).start()
+
+            async def send_with_profile_id(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-profile-id", profiler.id.encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_profile_id)
+            finally:
+                profiler.stop()
+        finally:
+            _in_flight -= 1
+
+
+def list_profiles() -> List[Dict[str, Any]]:
+    """Summaries of the stored profiles, most recent first."""
+    with _profiles_lock:
+        profiles = list(_profiles)
+    return [
+        {key: value for key, value in p.items() if key != "samples"}
+        for p in reversed(profiles)
+    ]
+
+
+def get_profile(profile_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a stored profile by ID."""
+    with _profiles_lock:
+        for p in _profiles:
+            if p["id"] == profile_id:
+                return p
+    return None
+
+
+def to_collapsed(profile: Dict[str, Any]) -> str:
+    """Render a profile in collapsed-stack format for flamegraph tools."""
+    return "\n".join(
+        f"{stack} {count}"
+        for stack, count in sorted(profile["samples"].items())
+    ) + "\n"
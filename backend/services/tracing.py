@@ -0,0 +1,190 @@
+# backend/services/tracing.py
+"""
+Lightweight OpenTelemetry-style tracing.
+Spans are tracked per request via contextvars and exported as JSON lines,
+so traces work locally without running a collector.
+
+Configure with environment variables:
+    TRACE_EXPORTER: "none" (default), "console" or "file"
+    TRACE_FILE: output path for the file exporter (default: traces.jsonl)
+
+Spans are handed to a queue and written by a background thread, so
+exporting never adds blocking I/O to the request being traced.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import secrets
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger("tracing")
+
+TRACE_EXPORTER = os.getenv("TRACE_EXPORTER", "none").lower()
+TRACE_FILE = os.getenv("TRACE_FILE", "traces.jsonl")
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+def _build_span_logger() -> Optional[logging.Logger]:
+    """Route span records through a queue to the configured exporter."""
+    if TRACE_EXPORTER == "file":
+        handler: logging.Handler = logging.FileHandler(TRACE_FILE, encoding="utf-8")
+    elif TRACE_EXPORTER == "console":
+        handler = logging.StreamHandler(sys.stderr)
+    else:
+        return None
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    span_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(span_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    span_logger = logging.getLogger("tracing.spans")
+    span_logger.setLevel(logging.INFO)
+    span_logger.propagate = False
+    span_logger.addHandler(QueueHandler(span_queue))
+    return span_logger
+
+
+_span_logger = _build_span_logger()
+
+
+class Span:
+    """A single timed operation within a trace."""
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self.start_time = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self.duration_ms: Optional[float] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        self.duration_ms = round((time.perf_counter() - self._start) * 1000, 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time.isoformat(),
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+@contextmanager
+def span(
+    name: str,
+    parent: Optional[Tuple[str, str]] = None,
+    **attributes: Any,
+) -> Iterator[Span]:
+    """
+    Open a span as a child of the current span.
+
+    Args:
+        name: Operation name, e.g. "supabase.calls.select"
+        parent: Remote (trace_id, span_id) to join instead of the current span
+        **attributes: Extra key/value pairs recorded on the span
+    """
+    current = _current_span.get()
+    if parent:
+        trace_id, parent_id = parent
+    elif current:
+        trace_id, parent_id = current.trace_id, current.span_id
+    else:
+        trace_id, parent_id = secrets.token_hex(16), None
+
+    s = Span(name, trace_id, parent_id, attributes)
+    token = _current_span.set(s)
+    try:
+        yield s
+    except BaseException as e:
+        s.status = "error"
+        s.error = str(e) or type(e).__name__
+        raise
+    finally:
+        s.end()
+        _current_span.reset(token)
+        _export(s)
+
+
+def db_span(table: str, operation: str, **attributes: Any):
+    """Span for a single Supabase query."""
+    return span(f"supabase.{table}.{operation}", db_table=table, db_operation=operation, **attributes)
+
+
+def traced(name: str):
+    """Decorator that wraps a synchronous function in a span."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def current_traceparent() -> Optional[str]:
+    """Return the current span as a W3C traceparent string, if any."""
+    current = _current_span.get()
+    if not current:
+        return None
+    return f"00-{current.trace_id}-{current.span_id}-01"
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Parse a W3C traceparent string into (trace_id, span_id)."""
+    if not value or not isinstance(value, str):
+        return None
+    parts = value.split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        int(parts[1], 16)
+        int(parts[2], 16)
+    except ValueError:
+        return None
+    return parts[1], parts[2]
+
+
+def _export(s: Span) -> None:
+    """Queue a finished span for the configured exporter."""
+    if _span_logger is None:
+        return
+    try:
+        _span_logger.info(json.dumps(s.to_dict(), default=str))
+    except Exception as e:
+        logger.warning(f"Failed to export span {s.name}: {e}")